@@ -1,3 +1,3 @@
-from imaqbindings.bindings import Board, Buffer
+from imaqbindings.bindings import Board, Buffer, IMAQError
 
-__all__ = ['Board', 'Buffer']
\ No newline at end of file
+__all__ = ['Board', 'Buffer', 'IMAQError']
\ No newline at end of file
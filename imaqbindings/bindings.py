@@ -1,16 +1,25 @@
 import ctypes
+import logging
+import time
+import weakref
 from ctypes import (
     POINTER, byref, c_void_p, c_int32, c_uint32, c_char_p, c_int8
 )
+from math import prod
+from types import SimpleNamespace
 
 import numpy as np
 
 from imaqbindings.enumerations import (
-    IMAQAttribute, BufferLocation, BufferElement, BufferCommand
+    IMAQAttribute, BufferLocation, BufferElement, BufferCommand, SignalType,
+    StatusSignal, StatusInformation, TriggerPolarity
 )
 from imaqbindings import enumerations as imenum
 
 
+logger = logging.getLogger(__name__)
+
+
 # Load the IMAQ DLL
 try:
     imaq = ctypes.CDLL("imaq.dll")
@@ -18,46 +27,102 @@ except OSError as e:
     raise RuntimeError(f"Could not find 'imaq.dll'. Check whether NI-IMAQ software is properly installed.")
 
 
+class IMAQError(Exception):
+    """ Error returned by the NI IMAQ C API; `code` is the status code. """
+    def __init__(self, message: str, code: int):
+        super().__init__(message)
+        self.code = code
+
+
 # Define error checking function
 imaq.imgShowError.restype = c_int32
 imaq.imgShowError.argtypes = [c_int32, POINTER(ctypes.c_char * 256)]
 def check_error(result, func, arguments):
     """ 
-    Check return value from NI IMAQ C API and raise Exception if error with
+    Check return value from NI IMAQ C API and raise IMAQError if error with
     information as Exception. """
     if result != 0:
         str_buffer = ctypes.create_string_buffer(256)
         imaq.imgShowError(result, byref(str_buffer))
         imaq_error_str = str_buffer.value.decode()
-        raise Exception(
-            f"Error calling function {func.__name__} with arguments {arguments} : {imaq_error_str}"
+        raise IMAQError(
+            f"Error calling function {func.__name__} with arguments {arguments} : {imaq_error_str}",
+            result
         )
 
 
+# Status code of a wait that timed out
+_IMG_ERR_TIMEOUT = -1074397150
+
+# Longest single wait in Board.wait_next_buffer(), in seconds
+_WAIT_SLICE = 0.02
+
+
+# Name fragments kept upper case when translating method names to C names,
+# e.g. imgSessionConfigureROI, imgSessionSetUserLUT8bit
+_ACRONYMS = frozenset(["roi", "lut"])
+
+# Plain int copies of the buffer list codes, passed to ctypes on hot paths
+_IMG_BUFF_ADDRESS = int(BufferElement.IMG_BUFF_ADDRESS)
+_IMG_BUFF_COMMAND = int(BufferElement.IMG_BUFF_COMMAND)
+_IMG_BUFF_SIZE = int(BufferElement.IMG_BUFF_SIZE)
+
+# Buffer commands accepted by name in Board.set_buffer_element_command()
+_BUF_CMDS = {
+    "next": int(BufferCommand.IMG_CMD_NEXT),
+    "loop": int(BufferCommand.IMG_CMD_LOOP),
+    "pass": int(BufferCommand.IMG_CMD_PASS),
+    "stop": int(BufferCommand.IMG_CMD_STOP),
+}
+
+
+def _buffer_command(command: BufferCommand | int | str) -> int:
+    """
+    Resolves a buffer command given as a BufferCommand, its int value, or by 
+    name.
+    """
+    if isinstance(command, int):
+        try:
+            return int(BufferCommand(command))
+        except ValueError:
+            raise TypeError("Unrecognized buffer element command") from None
+    try:
+        return _BUF_CMDS[command.lower()]
+    except (KeyError, AttributeError):
+        raise TypeError("Unrecognized buffer element command") from None
+
+
+def _c_function_name(method_name: str) -> str:
+    """
+    Translates a wrapper method name to the NI-IMAQ C function name, e.g.
+    'session_serial_read' -> 'imgSessionSerialRead'.
+    """
+    func_name = "img"
+    for x in method_name.split('_'):
+        if x in _ACRONYMS: 
+            x = x.upper()
+        else:
+            x = x.capitalize()
+        func_name += x
+    return func_name
+
+
 def ctypes_sig(argtypes, restype=c_int32, errcheck=check_error):
     """
-    Automates setting wrapped ctypes function signature fields
+    Automates setting wrapped ctypes function signature fields.
+
+    The signature is set once, when the class body is evaluated. The
+    decorated method is returned unchanged so calls do not go through an
+    extra Python wrapper.
     """
     def decorator(func):
-        func_name = "img"
-        acronyms = ["sdk", "id", "io", "cpld", "fpga", "led"] # TODO, copied from Alazar wrapper, check what's needed
-        for x in func.__name__.split('_'):
-            if x in acronyms: 
-                x = x.upper()
-            else:
-                x = x.capitalize()
-            func_name += x
-        
-        ctypes_func = getattr(imaq, func_name)
+        ctypes_func = getattr(imaq, _c_function_name(func.__name__))
         ctypes_func.restype = restype
         ctypes_func.argtypes = argtypes
         if errcheck is not None:
             ctypes_func.errcheck = errcheck
 
-        # Wrapped function to call the actual ctypes function
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        return wrapper
+        return func
     return decorator
 
 
@@ -69,18 +134,41 @@ class Board:
     Args:
       device_name (int): The name identified in NI MAX. Defaults to "img0".
       timeout (float): Amount of time to wait for serial response.
+
+    The serial methods reuse per-Board read buffers and must not be called 
+    from more than one thread at a time.
     """
     def __init__(self, device_name: str = "img0", timeout:float = 0.5):
         self._ifid = None # Interface ID
         self._sid = None # Session ID
         self._bid = None # Buffer list ID
-        self.buffers = []
+        self.buffers = weakref.WeakSet() # Live Buffers created on this board
         self.serial_timeout = timeout # in seconds
+        self._serial_buffers = {} # Reusable serial read buffers, by size
+        self._serial_buf_size = c_uint32()
+        self._next_buffer = 0 # Next cumulative buffer number for wait_next_buffer()
         
         # Open the interface & session
         self._ifid = self._interface_open(device_name) # prefer 'device name' over 'interface name'
         self._sid = self._session_open()
 
+        # Cached C functions for the most frequent calls
+        self._imgGetAttribute = imaq.imgGetAttribute
+        self._imgSetAttribute2 = imaq.imgSetAttribute2
+        self._imgGetBufferElement = imaq.imgGetBufferElement
+        self._imgSetBufferElement = imaq.imgSetBufferElement
+        self._imgSetBufferElement2 = imaq.imgSetBufferElement2
+
+    @property
+    def serial_timeout(self) -> float:
+        """ Amount of time (in seconds) to wait for serial response. """
+        return self._serial_timeout
+
+    @serial_timeout.setter
+    def serial_timeout(self, value: float):
+        self._serial_timeout = value
+        self._timeout_ms = round(value*1000)
+
     @ctypes_sig([c_char_p, POINTER(c_uint32)])
     def _interface_open(self, interface_name: str):
         """
@@ -108,7 +196,7 @@ class Board:
         Returns an attribute value.
         """
         value = c_uint32() # may need to make this a void pointer
-        imaq.imgGetAttribute(self._sid, attr, byref(value))
+        self._imgGetAttribute(self._sid, attr, byref(value))
         return value.value
     
     @ctypes_sig([c_uint32, c_uint32, c_uint32])
@@ -118,7 +206,7 @@ class Board:
 
         Not implemented: setting uint64 or double values.
         """
-        imaq.imgSetAttribute2(self._sid, attr, value)
+        self._imgSetAttribute2(self._sid, attr, value)
 
     @ctypes_sig([c_uint32, POINTER(c_uint32)])
     def create_buf_list(self, num_elements: int):
@@ -129,7 +217,7 @@ class Board:
         """
         bid = c_uint32()
         imaq.imgCreateBufList(num_elements, byref(bid))       
-        #print(f"Buffer list with {num_elements} elements created.")
+        logger.debug("Buffer list with %d elements created.", num_elements)
         self._bid = bid
 
     @ctypes_sig([c_uint32, c_uint32, c_uint32, POINTER(c_uint32)])
@@ -138,7 +226,7 @@ class Board:
         Gets the value for a specified itemType for a buffer in a buffer list.
         """
         item_value = c_uint32()
-        imaq.imgGetBufferElement(self._bid, element, item_type, byref(item_value))
+        self._imgGetBufferElement(self._bid, element, item_type, byref(item_value))
         return item_value.value
     
     @ctypes_sig([c_uint32, c_uint32, c_uint32, c_uint32])
@@ -150,7 +238,7 @@ class Board:
         buffers.Use convenience methods set_buffer_element_address(), 
         set_buffer_element_size(), and set_buffer_element_command().
         """
-        imaq.imgSetBufferElement(self._bid, element, item_type, item_value)
+        self._imgSetBufferElement(self._bid, element, item_type, item_value)
 
     @ctypes_sig([c_uint32, c_uint32, c_uint32, c_void_p])
     def set_buffer_element_2(self, element: int, item_type: BufferElement, value_pointer):
@@ -165,24 +253,102 @@ class Board:
         Sets buffer list element pointer to allocated buffer memory.        
         Convenience method: calls set_buffer_element_from_void_ptr()
         """
-        self.set_buffer_element_2(element, BufferElement.IMG_BUFF_ADDRESS, address)
+        self.set_buffer_element_2(element, _IMG_BUFF_ADDRESS, address)
                                   
     def set_buffer_element_size(self, element: int, size_bytes: int):
         """
         Sets buffer list element size.
         Convenience method: calls set_buffer_element()
         """
-        self.set_buffer_element(element, BufferElement.IMG_BUFF_SIZE, size_bytes)
+        self.set_buffer_element(element, _IMG_BUFF_SIZE, size_bytes)
 
-    def set_buffer_element_command(self, element: int, command: BufferCommand):
+    def set_buffer_element_command(self, element: int, command: BufferCommand | int | str):
         """
-        Sets the buffer command. 
+        Sets the buffer command. The command may be a BufferCommand, its int 
+        value, or its name ("next", "loop", "pass", "stop").
         Convenience method: calls set_buffer_element()
         """
-        if not isinstance(command, BufferCommand):
-            raise TypeError("Unrecognized buffer element command")
-            
-        self.set_buffer_element(element, BufferElement.IMG_BUFF_COMMAND, command)
+        command = _buffer_command(command)
+        self.set_buffer_element(element, _IMG_BUFF_COMMAND, command)
+
+    def configure_buffer_element(self, 
+                                 element: int, 
+                                 address, 
+                                 size_bytes: int, 
+                                 command: BufferCommand | int | str):
+        """
+        Sets the address, size, and command of one buffer list element.
+        
+        Equivalent to calling set_buffer_element_address(), 
+        set_buffer_element_size(), and set_buffer_element_command(), but calls 
+        the C functions directly.
+        """
+        bid = self._bid
+        command = _buffer_command(command)
+        self._imgSetBufferElement2(bid, element, _IMG_BUFF_ADDRESS, address)
+        self._imgSetBufferElement(bid, element, _IMG_BUFF_SIZE, size_bytes)
+        self._imgSetBufferElement(bid, element, _IMG_BUFF_COMMAND, command)
+
+    def configure_buffer_list(self, 
+                              addresses, 
+                              size_bytes: int, 
+                              command: BufferCommand | int | str = "next"):
+        """
+        Sets address, size, and command for each element of the buffer list, 
+        with element i pointing to addresses[i]. All elements get the same 
+        size and command.
+
+        addresses may be a sequence or a numpy integer array.
+        """
+        if isinstance(addresses, np.ndarray):
+            addresses = addresses.tolist()
+        
+        # Bind to locals for the loop
+        bid = self._bid
+        command = _buffer_command(command)
+        addr_code = _IMG_BUFF_ADDRESS
+        size_code = _IMG_BUFF_SIZE
+        cmd_code = _IMG_BUFF_COMMAND
+        set_element = self._imgSetBufferElement
+        set_element_2 = self._imgSetBufferElement2
+        for element, address in enumerate(addresses):
+            set_element_2(bid, element, addr_code, address)
+            set_element(bid, element, size_code, size_bytes)
+            set_element(bid, element, cmd_code, command)
+
+    def init_buffer_list(self, addresses, size_bytes: int):
+        """
+        Initializes the buffer list as a ring: every element gets its address,
+        size, and the NEXT command, except the last, which gets LOOP.
+        
+        addresses may be any iterable, or a numpy integer array.
+        Convenience method: calls configure_buffer_list()
+        """
+        if isinstance(addresses, np.ndarray):
+            addresses = addresses.tolist()
+        else:
+            addresses = list(addresses)
+        if not addresses:
+            raise ValueError("Buffer list needs at least one address")
+        
+        last = len(addresses) - 1
+        self.configure_buffer_list(addresses[:last], size_bytes, BufferCommand.IMG_CMD_NEXT)
+        self.configure_buffer_element(last, addresses[last], size_bytes, BufferCommand.IMG_CMD_LOOP)
+
+    def fill_commands(self, start: int, count: int, command: BufferCommand | int | str):
+        """
+        Sets the same command on count consecutive buffer list elements, 
+        beginning at start. For a ring of N buffers:
+
+            board.fill_commands(0, N - 1, "next")
+            board.set_buffer_element_command(N - 1, "loop")
+        """
+        bid = self._bid
+        command = _buffer_command(command)
+        cmd_code = _IMG_BUFF_COMMAND
+        set_element = self._imgSetBufferElement
+        for element in range(start, start + count):
+            set_element(bid, element, cmd_code, command)
 
     @ctypes_sig([c_uint32, c_uint32])
     def session_configure(self):
@@ -200,12 +366,68 @@ class Board:
         in the associated session buffer list.
 
         If async_flag is false, this function does not return until the 
-        acquisition completes.
+        acquisition completes. The GIL is released while the DLL call blocks, 
+        so other threads (e.g. a consumer using wait_next_buffer() and 
+        nogil Numba kernels) can process buffers during the acquisition.
 
         Not implemented: callback function
         """
+        self._next_buffer = 0
         imaq.imgSessionAcquire(self._sid, async_flag, None)
 
+    @ctypes_sig([c_uint32, c_uint32, c_uint32, c_uint32, c_uint32])
+    def session_wait_signal_2(self, 
+                              signal_type: SignalType, 
+                              signal_identifier: int, 
+                              polarity: TriggerPolarity, 
+                              timeout: float):
+        """
+        Waits for a signal to be asserted, or until the timeout (in seconds) 
+        elapses.
+
+        The wait happens inside the DLL with the GIL released, so other Python 
+        threads keep running.
+        """
+        timeout_ms = round(timeout*1000)
+        imaq.imgSessionWaitSignal2(self._sid, signal_type, signal_identifier, 
+                                   polarity, timeout_ms)
+
+    def wait_next_buffer(self, timeout: float = 1.0) -> int:
+        """
+        Returns the cumulative number of the next buffer after the one returned
+        by the previous call (starting from 0 at session_acquire()), blocking 
+        until that buffer is filled.
+
+        Buffers are returned in order, without gaps: if the caller falls 
+        behind, completed buffers are returned immediately. The buffer list 
+        index is the returned number modulo the ring length; if the caller 
+        falls more than a ring length behind, that buffer has been overwritten.
+
+        Use instead of polling IMG_ATTR_LAST_VALID_BUFFER. Raises TimeoutError 
+        if the buffer is not filled within the timeout (in seconds).
+        """
+        wanted = self._next_buffer
+        deadline = time.monotonic() + timeout
+        while self.get_attribute(StatusInformation.IMG_ATTR_FRAME_COUNT) <= wanted:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Buffer {wanted} not filled within {timeout} s")
+            # Wait in short slices: a buffer completing between the frame count 
+            # check and the wait raises no further edge, so the count must be 
+            # checked again rather than relying on a later completion
+            try:
+                self.session_wait_signal_2(
+                    SignalType.IMG_SIGNAL_STATUS, 
+                    StatusSignal.IMG_BUF_COMPLETE, 
+                    TriggerPolarity.IMG_TRIG_POLAR_ACTIVEH, 
+                    min(remaining, _WAIT_SLICE)
+                )
+            except IMAQError as e:
+                if e.code != _IMG_ERR_TIMEOUT:
+                    raise
+        self._next_buffer = wanted + 1
+        return wanted
+
     @ctypes_sig([c_uint32, POINTER(c_uint32)])
     def session_abort(self):
         """
@@ -233,12 +455,11 @@ class Board:
         """
         buffer = command.encode('ascii')
         buf_size = c_uint32(len(buffer))
-        buf_size_p = POINTER(c_uint32)(buf_size)
-        timeout_ms = round(self.serial_timeout*1000)
 
         self.session_serial_flush()
-        imaq.imgSessionSerialWrite(self._sid, buffer, buf_size_p, timeout_ms)
+        imaq.imgSessionSerialWrite(self._sid, buffer, byref(buf_size), self._timeout_ms)
 
+    @ctypes_sig([c_uint32, c_void_p, POINTER(c_uint32), c_uint32], errcheck=None)
     def session_serial_read(self, buffer_size: int = 256):
         """
         Reads in data from the serial port on devices that support serial 
@@ -246,15 +467,15 @@ class Board:
         from the serial port until either a termination character has been 
         received or the timeout period has elapsed.
         """
-        buffer = ctypes.create_string_buffer(buffer_size)
-        buf_size = c_uint32(buffer_size)
-        buf_size_p = POINTER(c_uint32)(buf_size)
-        timeout_ms = round(self.serial_timeout*1000)
+        buffer = self._serial_buffer(buffer_size)
+        buf_size = self._serial_buf_size
+        buf_size.value = buffer_size
 
-        imaq.imgSessionSerialRead(self._sid, buffer, buf_size_p, timeout_ms)
+        imaq.imgSessionSerialRead(self._sid, buffer, byref(buf_size), self._timeout_ms)
 
         return buffer.raw[:buf_size.value].decode('ascii')
     
+    @ctypes_sig([c_uint32, c_void_p, POINTER(c_uint32), c_uint32], errcheck=None)
     def session_serial_read_bytes(self, buffer_size: int = 8):
         """
         Reads in an expected number of bytes from the serial port on image 
@@ -263,36 +484,79 @@ class Board:
         either the buffer is full or the timeout period has elapsed. When you 
         use this function, the serial termination string attribute is ignored. 
         """
-        buffer = ctypes.create_string_buffer(buffer_size)
-        buf_size = c_uint32(buffer_size)
-        buf_size_p = POINTER(c_uint32)(buf_size)
-        timeout_ms = round(self.serial_timeout*1000)
+        buffer = self._serial_buffer(buffer_size)
+        buf_size = self._serial_buf_size
+        buf_size.value = buffer_size
 
-        imaq.imgSessionSerialReadBytes(self._sid, buffer, buf_size_p, timeout_ms)
+        imaq.imgSessionSerialReadBytes(self._sid, buffer, byref(buf_size), self._timeout_ms)
 
         return buffer.raw[:buf_size.value].decode('ascii')
     
+    def _serial_buffer(self, buffer_size: int):
+        """
+        Returns a reusable string buffer of the requested size, allocating it
+        on first use.
+        """
+        buffer = self._serial_buffers.get(buffer_size)
+        if buffer is None:
+            buffer = ctypes.create_string_buffer(buffer_size)
+            self._serial_buffers[buffer_size] = buffer
+        return buffer
+
     def close(self, free_resources: bool = True):
-        """ Close the session and interface."""
-        if self._sid:
+        """ Close the session and interface. Safe to call more than once. """
+        if self._sid is None and self._ifid is None:
+            return
+        
+        if free_resources:
+            # imgClose frees the session's buffers; keep Buffers from freeing 
+            # them again
+            for buffer in list(self.buffers):
+                buffer._disposed = True
+
+        if self._sid is not None:
             self._close(self._sid, free_resources) 
             self._sid = None
         
         # Close the interface
-        if self._ifid:
+        if self._ifid is not None:
             self._close(self._ifid, free_resources) 
             self._ifid = None
         
-        print("Board closed successfully.")
+        logger.info("Board closed successfully.")
 
     @ctypes_sig([c_uint32, c_uint32])
     def _close(self, xid: c_uint32, free_resources: bool):
         imaq.imgClose(xid, free_resources)
     
-    def __del__(self):
-        # Automatically close hardware
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
 
+    def __del__(self):
+        # Automatically close hardware; at interpreter shutdown logging (or the 
+        # DLL) may already be torn down
+        try:
+            self.close()
+        except:
+            pass
+
+
+def _array_from_address(address: int, shape: tuple[int, ...], dtype) -> np.ndarray:
+    """
+    Returns a writeable numpy view of memory at a raw address, without an
+    intermediate ctypes array object. The view does not own the memory.
+    """
+    interface = SimpleNamespace(__array_interface__={
+        'data': (address, False),
+        'shape': shape,
+        'typestr': np.dtype(dtype).str,
+        'version': 3,
+    })
+    return np.asarray(interface)
+
 
 class Buffer:
     """
@@ -308,11 +572,12 @@ class Buffer:
         if board._sid is None:
             raise RuntimeError("Board session not initialized")
         
-        self._size_bytes = int(np.prod(shape)) * bytes_per_pixel
+        self._size_bytes = int(prod(shape) * bytes_per_pixel)
         self._sid = board._sid
 
         # Make a null pointer to byte array
         self.ptr = POINTER(c_int8)()
+        self._disposed = True # until the buffer is created
 
         self._create_buffer(
             sid=self._sid, 
@@ -320,10 +585,11 @@ class Buffer:
             buffer_size=self._size_bytes,
             buffer_ptr_addr=byref(self.ptr)
         )
+        self._disposed = False
+        board.buffers.add(self)
 
         self._adr = ctypes.addressof(self.ptr.contents)
 
-        ctypes_array = (c_int8 * self._size_bytes).from_address(self._adr)
         if bytes_per_pixel == 1:
             dtype = np.uint8
             shape = (*shape, 1)
@@ -334,9 +600,7 @@ class Buffer:
             dtype = np.uint8
             shape = (*shape, bytes_per_pixel)
 
-        self.buffer = np.frombuffer(ctypes_array, dtype=dtype)
-        self.buffer.shape = shape
-        self.ctypes_buffer = ctypes_array
+        self.buffer = _array_from_address(self._adr, shape, dtype)
     
     @ctypes_sig([c_uint32, c_uint32, c_uint32, POINTER(POINTER(ctypes.c_int8))])
     def _create_buffer(self, 
@@ -345,11 +609,70 @@ class Buffer:
                        buffer_size: int, 
                        buffer_ptr_addr):
         imaq.imgCreateBuffer(sid, where, buffer_size, buffer_ptr_addr)
+
+    def apply(self, kernel, *args):
+        """
+        Calls kernel(self.buffer, *args) and returns its result.
+
+        The kernel receives the numpy view of the DMA memory itself, not a 
+        copy, so it can process pixels in place. A Numba-compiled function 
+        (e.g. @njit(parallel=True, cache=True)) avoids Python-level per-pixel
+        loops.
+        """
+        return kernel(self.buffer, *args)
+
+    def as_numba_array(self) -> tuple[int, tuple[int, ...], np.dtype]:
+        """
+        Returns (address, shape, dtype) of the DMA memory, for rebuilding the 
+        array inside nopython code without passing the Buffer object:
+
+            arr = numba.carray(address_as_void_pointer(adr), shape, dtype)
+
+        See imaqbindings.numba_support. The Buffer must stay alive (and not be
+        closed) while the kernel runs.
+        """
+        return self._adr, self.buffer.shape, self.buffer.dtype
+
+    def convert(self, fmt: str, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Returns a converted copy of the buffer contents.
+
+        Formats:
+          "byteswap16": swap the byte order of 2-byte pixels
+          "bgrx_to_rgb": drop the padding byte of 4-byte BGRX pixels and 
+            reorder to RGB
+
+        If out is given, the result is written into it (it must have the 
+        result's shape and dtype) and out is returned. The DMA buffer itself is
+        never modified.
+        """
+        src = self.buffer
+        if fmt == "byteswap16":
+            if src.dtype != np.uint16:
+                raise ValueError("byteswap16 requires a 2 byte per pixel buffer")
+            if out is None:
+                return src.byteswap()
+            np.copyto(out, src)
+            return out.byteswap(inplace=True)
+        elif fmt == "bgrx_to_rgb":
+            if src.shape[-1] != 4:
+                raise ValueError("bgrx_to_rgb requires a 4 byte per pixel buffer")
+            if out is None:
+                return np.ascontiguousarray(src[..., 2::-1])
+            np.copyto(out, src[..., 2::-1])
+            return out
+        else:
+            raise ValueError(f"Unrecognized conversion format: {fmt}")
     
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def __del__(self):
         try:
-            self._dispose_buffer(self.ptr)
-            print("Disposed buffer")
+            self.close()
         except:
             pass
 
@@ -358,6 +681,10 @@ class Buffer:
         imaq.imgDisposeBuffer(ptr)
 
     def close(self):
-        """ Explicitly dispose the buffer. """
-        self.__del__()
+        """ Explicitly dispose the buffer. Safe to call more than once. """
+        if self._disposed:
+            return
+        self._disposed = True
+        self._dispose_buffer(self.ptr)
+        logger.debug("Disposed buffer")
 
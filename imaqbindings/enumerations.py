@@ -255,6 +255,24 @@ class SignalType(IntEnum):
     IMG_SIGNAL_SOFTWARE_TRIGGER     = 6
 
 
+class StatusSignal(IntEnum):
+    """
+    Enumerates status signal identifiers, used with IMG_SIGNAL_STATUS.
+
+    Enumeration Members:
+        IMG_AQ_DONE: Acquisition done
+        IMG_FRAME_START: Start of a frame
+        IMG_FRAME_DONE: End of a frame
+        IMG_BUF_COMPLETE: A buffer has been filled
+        IMG_AQ_IN_PROGRESS: Acquisition in progress
+    """
+    IMG_AQ_DONE             = 0x08
+    IMG_FRAME_START         = 0x10
+    IMG_FRAME_DONE          = 0x20
+    IMG_BUF_COMPLETE        = 0x40
+    IMG_AQ_IN_PROGRESS      = 0x80
+
+
 class TriggerPolarity(IntEnum):
     """
     Enumerates trigger polarities (active high, active low)
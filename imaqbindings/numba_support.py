@@ -0,0 +1,22 @@
+"""
+Helpers for working on IMAQ buffers from Numba nopython code.
+
+Requires the optional numba dependency: pip install imaqbindings[numba]
+"""
+
+from numba import types
+from numba.core import cgutils
+from numba.extending import intrinsic
+
+
+@intrinsic
+def address_as_void_pointer(typingctx, src):
+    """
+    Converts an integer address (e.g. from Buffer.as_numba_array()) to a void
+    pointer, for use with numba.carray() inside nopython code.
+    """
+    sig = types.voidptr(src)
+
+    def codegen(cgctx, builder, sig, args):
+        return builder.inttoptr(args[0], cgutils.voidptr_t)
+    return sig, codegen
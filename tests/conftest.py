@@ -0,0 +1,51 @@
+import ctypes
+import importlib
+import sys
+
+import pytest
+
+
+class StubFunction:
+    """ Stands in for a DLL function; applies errcheck like ctypes does. """
+    def __init__(self, library, name):
+        self.__name__ = name
+        self._library = library
+        self.errcheck = None
+
+    def __call__(self, *args):
+        self._library.calls.append((self.__name__, args))
+        handler = self._library.handlers.get(self.__name__)
+        result = handler(*args) if handler else 0
+        if self.errcheck is not None:
+            self.errcheck(result, self, args)
+        return result
+
+
+class StubLibrary:
+    """ Stands in for imaq.dll; returns 0 (success) unless a handler is set. """
+    def __init__(self):
+        self.calls = []
+        self.handlers = {'imgCreateBuffer': self._create_buffer}
+        self.memory = []
+
+    def _create_buffer(self, sid, where, buffer_size, buffer_ptr_addr):
+        memory = (ctypes.c_int8 * buffer_size)()
+        self.memory.append(memory)
+        buffer_ptr_addr._obj.contents = ctypes.c_int8.from_buffer(memory)
+        return 0
+
+    def __getattr__(self, name):
+        func = StubFunction(self, name)
+        setattr(self, name, func)
+        return func
+
+
+@pytest.fixture
+def imaq_stub(monkeypatch):
+    """ Imports imaqbindings.bindings against a stub imaq.dll. """
+    stub = StubLibrary()
+    monkeypatch.setattr(ctypes, "CDLL", lambda name: stub)
+    monkeypatch.delitem(sys.modules, "imaqbindings.bindings", raising=False)
+    bindings = importlib.import_module("imaqbindings.bindings")
+    yield bindings, stub
+    sys.modules.pop("imaqbindings.bindings", None)
@@ -0,0 +1,29 @@
+def test_c_function_name(imaq_stub):
+    bindings, _ = imaq_stub
+    assert bindings._c_function_name("session_serial_read_bytes") == "imgSessionSerialReadBytes"
+    assert bindings._c_function_name("_interface_open") == "imgInterfaceOpen"
+    assert bindings._c_function_name("set_attribute_2") == "imgSetAttribute2"
+    assert bindings._c_function_name("session_configure_roi") == "imgSessionConfigureROI"
+    assert bindings._c_function_name("session_set_user_lut_8bit") == "imgSessionSetUserLUT8bit"
+
+
+def test_board_close_frees_buffers_once(imaq_stub):
+    bindings, stub = imaq_stub
+    with bindings.Board() as board:
+        buffers = [bindings.Buffer(board, (4, 4), 1) for _ in range(2)]
+    for buffer in buffers:
+        buffer.close()
+    del buffers
+
+    assert [name for name, _ in stub.calls].count('imgDisposeBuffer') == 0
+
+
+def test_buffer_close_is_idempotent(imaq_stub):
+    bindings, stub = imaq_stub
+    board = bindings.Board()
+    buffer = bindings.Buffer(board, (4, 4), 1)
+    buffer.close()
+    buffer.close()
+    board.close()
+
+    assert [name for name, _ in stub.calls].count('imgDisposeBuffer') == 1
@@ -0,0 +1,73 @@
+import pytest
+
+
+@pytest.fixture
+def board(imaq_stub):
+    """ Board on a stub DLL whose frame count is state['count']. """
+    bindings, stub = imaq_stub
+    state = {'count': 0}
+    frame_count = bindings.StatusInformation.IMG_ATTR_FRAME_COUNT
+
+    def get_attribute(sid, attr, value_ref):
+        if attr == frame_count:
+            value_ref._obj.value = state['count']
+        return 0
+
+    stub.handlers['imgGetAttribute'] = get_attribute
+    board = bindings.Board()
+    yield board, bindings, stub, state
+    board.close()
+
+
+def wait_calls(stub):
+    return [args for name, args in stub.calls if name == 'imgSessionWaitSignal2']
+
+
+def test_returns_completed_buffers_in_order_without_waiting(board):
+    board, _, stub, state = board
+    state['count'] = 3
+
+    assert [board.wait_next_buffer() for _ in range(3)] == [0, 1, 2]
+    assert wait_calls(stub) == []
+
+
+def test_buffer_filled_before_wait_is_not_missed(board):
+    board, bindings, stub, state = board
+
+    def wait_signal(*args):
+        # Buffer completes before the wait starts: no edge, wait times out
+        state['count'] = 1
+        return bindings._IMG_ERR_TIMEOUT
+
+    stub.handlers['imgSessionWaitSignal2'] = wait_signal
+
+    assert board.wait_next_buffer(timeout=1.0) == 0
+    assert len(wait_calls(stub)) == 1
+
+
+def test_timeout_raises_timeout_error(board):
+    board, bindings, stub, state = board
+    stub.handlers['imgSessionWaitSignal2'] = lambda *args: bindings._IMG_ERR_TIMEOUT
+
+    with pytest.raises(TimeoutError):
+        board.wait_next_buffer(timeout=0.05)
+    timeouts_ms = [args[4] for args in wait_calls(stub)]
+    assert timeouts_ms and max(timeouts_ms) <= round(bindings._WAIT_SLICE*1000)
+
+
+def test_other_wait_errors_propagate(board):
+    board, bindings, stub, state = board
+    stub.handlers['imgSessionWaitSignal2'] = lambda *args: -1
+
+    with pytest.raises(bindings.IMAQError) as excinfo:
+        board.wait_next_buffer(timeout=0.05)
+    assert excinfo.value.code == -1
+
+
+def test_session_acquire_restarts_numbering(board):
+    board, _, stub, state = board
+    state['count'] = 2
+    assert [board.wait_next_buffer(), board.wait_next_buffer()] == [0, 1]
+
+    board.session_acquire(True)
+    assert board.wait_next_buffer() == 0